@@ -1,28 +1,96 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .binance_rest import RESTClient, BinanceRESTError
+from .rate_limit import TokenBucket
 from .symbol_filters import SymbolFilterCache
 from .config import Settings
 
 logger = logging.getLogger(__name__)
 
 
-VALID_SIDES = {"BUY", "SELL"}
-VALID_ORDER_TYPES = {
+VALID_SIDES = frozenset({"BUY", "SELL"})
+VALID_ORDER_TYPES = frozenset({
     "market",
     "limit",
     "stop_limit",        # maps to STOP (stop + limit price)
     "stop_market",       # maps to STOP_MARKET (stop trigger only)
     "take_profit",       # maps to TAKE_PROFIT (tp + limit price)
     "take_profit_market" # maps to TAKE_PROFIT_MARKET (tp trigger only)
+})
+
+# Required-field bitmask per order type, checked with a single compare in validate()
+_NEEDS_PRICE = 0b01
+_NEEDS_STOP = 0b10
+_TYPE_REQ: Dict[str, Tuple[int, str]] = {
+    "market": (0, ""),
+    "limit": (_NEEDS_PRICE, "Price required and must be positive for limit orders."),
+    "stop_limit": (_NEEDS_PRICE | _NEEDS_STOP, "price and stop_price required & positive for stop_limit / take_profit."),
+    "take_profit": (_NEEDS_PRICE | _NEEDS_STOP, "price and stop_price required & positive for stop_limit / take_profit."),
+    "stop_market": (_NEEDS_STOP, "stop_price required & positive for stop_market / take_profit_market."),
+    "take_profit_market": (_NEEDS_STOP, "stop_price required & positive for stop_market / take_profit_market."),
 }
 
+# (request attribute, Binance parameter, label used in error messages)
+_PRICE = ("price", "price", "Price")
+_STOP = ("stop_price", "stopPrice", "Stop price")
 
-@dataclass
+
+@dataclass(frozen=True)
+class OrderTypeSpec:
+    """How an order type maps onto Binance parameters."""
+
+    binance_type: str
+    price_fields: Tuple[Tuple[str, str, str], ...] = ()
+    tif: bool = False
+
+
+ORDER_TYPE_SPEC: Dict[str, OrderTypeSpec] = {
+    "market": OrderTypeSpec("MARKET"),
+    "limit": OrderTypeSpec("LIMIT", (_PRICE,), tif=True),
+    "stop_limit": OrderTypeSpec("STOP", (_PRICE, _STOP), tif=True),
+    "stop_market": OrderTypeSpec("STOP_MARKET", (_STOP,)),
+    "take_profit": OrderTypeSpec("TAKE_PROFIT", (_PRICE, _STOP), tif=True),
+    "take_profit_market": OrderTypeSpec("TAKE_PROFIT_MARKET", (_STOP,)),
+}
+
+# Upper bound on grid orders in flight at once, to overlap network round-trips.
+# This caps concurrency only; the order rate is bounded by the token bucket below.
+GRID_MAX_CONCURRENCY = 10
+
+# Live order submissions per second (sustained) and burst size, shared by every
+# caller of one BasicBot (single, grid, batch, web). Binance futures allows
+# 1200 orders/min and 300 per 10s per account; this leaves headroom for other clients.
+ORDER_RATE_PER_SEC = 10
+ORDER_BURST = 20
+
+# How often the background thread reloads exchangeInfo symbol filters
+FILTER_REFRESH_SECS = 300
+
+
+# String forms Binance uses for a flat position; anything else falls back to float()
+_ZERO_AMTS = frozenset({"0", "0.0", "0.00", "0.000", "0.00000000", "-0", ""})
+
+
+def non_zero_positions(positions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Filter a positionRisk payload down to positions with a non-zero positionAmt."""
+    return [p for p in positions if (amt := p.get("positionAmt", "0")) not in _ZERO_AMTS and float(amt) != 0]
+
+
+def _grid_prices(base_price: float, step_pct: float, levels: int, side: str) -> List[float]:
+    """Un-rounded grid ladder: descending below base for BUY, ascending above for SELL."""
+    step = (-step_pct if side == "BUY" else step_pct) / 100
+    return [base_price * (1 + step * i) for i in range(1, levels + 1)]
+
+
+@dataclass(slots=True, frozen=True)
 class OrderRequest:
     symbol: str
     side: str
@@ -32,22 +100,27 @@ class OrderRequest:
     stop_price: Optional[float] = None
     time_in_force: str = "GTC"
 
+    def __post_init__(self) -> None:
+        # Interned so ORDER_TYPE_SPEC / _TYPE_REQ lookups hit the identity fast path
+        if isinstance(self.order_type, str):
+            object.__setattr__(self, "order_type", sys.intern(self.order_type))
+
     def validate(self) -> None:
         if self.side not in VALID_SIDES:
-            raise ValueError(f"Invalid side: {self.side}. Must be one of {VALID_SIDES}.")
-        if self.order_type not in VALID_ORDER_TYPES:
+            raise ValueError(f"Invalid side: {self.side}. Must be one of {sorted(VALID_SIDES)}.")
+        req = _TYPE_REQ.get(self.order_type)
+        if req is None:
             raise ValueError(
-                f"Invalid order type: {self.order_type}. Must be one of {VALID_ORDER_TYPES}."
+                f"Invalid order type: {self.order_type}. Must be one of {sorted(VALID_ORDER_TYPES)}."
             )
         if self.quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        if self.order_type in {"limit"} and (self.price is None or self.price <= 0):
-            raise ValueError("Price required and must be positive for limit orders.")
-        if self.order_type in {"stop_limit", "take_profit"}:
-            if (self.price is None or self.price <= 0) or (self.stop_price is None or self.stop_price <= 0):
-                raise ValueError("price and stop_price required & positive for stop_limit / take_profit.")
-        if self.order_type in {"stop_market", "take_profit_market"} and (self.stop_price is None or self.stop_price <= 0):
-            raise ValueError("stop_price required & positive for stop_market / take_profit_market.")
+        req_bits, msg = req
+        got_bits = (self.price is not None and self.price > 0) | (
+            (self.stop_price is not None and self.stop_price > 0) << 1
+        )
+        if req_bits & got_bits != req_bits:
+            raise ValueError(msg)
 
 
 @dataclass
@@ -60,7 +133,7 @@ class OrderResponse:
 class BasicBot:
     """Simplified Futures Testnet trading bot using direct REST calls."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, background_refresh: bool = True):
         self.settings = settings
         if not settings.api_key or not settings.api_secret:
             logger.warning(
@@ -72,196 +145,142 @@ class BasicBot:
             api_secret=settings.api_secret or "",
             base_url=settings.base_url,
             recv_window=settings.recv_window,
+            pool_maxsize=settings.http_pool_size,
         )
         # Cache for symbol filters (tick size, step size)
-        self._symbol_filters = SymbolFilterCache()
+        self._symbol_filters = SymbolFilterCache(ttl=FILTER_REFRESH_SECS * 2)
+        self._order_limiter = TokenBucket(ORDER_RATE_PER_SEC, ORDER_BURST)
+        self._stop = threading.Event()
+        self._background: Optional[threading.Thread] = None
+        if background_refresh and not settings.dry_run:
+            # Warm-up and filter refresh run off the order path; dry-run stays free of constructor network calls.
+            # One-shot callers pass background_refresh=False and load filters on demand instead.
+            self._background = threading.Thread(target=self._background_loop, name="bot-background", daemon=True)
+            self._background.start()
+
+    def _background_loop(self) -> None:
+        """Warm the pooled HTTPS connection, then keep symbol filters fresh until close()."""
+        try:
+            # TLS handshake happens here rather than on the first user-visible order
+            self.client.futures_ping()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Warm-up ping failed: %s", e)
+        # First pass is a normal ensure() so filters the order path just loaded are not fetched again
+        force = False
+        while not self._stop.is_set():
+            try:
+                self._symbol_filters.ensure(self.client, force=force)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Symbol filter refresh failed: %s", e)
+            force = True
+            self._stop.wait(FILTER_REFRESH_SECS)
+
+    def close(self) -> None:
+        """Stop the background refresh thread, if one was started."""
+        self._stop.set()
+        if self._background is not None:
+            self._background.join(timeout=5)
+            self._background = None
+
+    def prefetch_filters(self) -> None:
+        """Start loading symbol filters in the background; returns immediately.
+
+        A no-op when the refresh thread is running, since its first pass already loads them.
+        """
+        if self._background is not None:
+            return
+
+        def _load() -> None:
+            try:
+                self._symbol_filters.ensure(self.client)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Symbol filter prefetch failed: %s", e)
 
+        threading.Thread(target=_load, name="symbol-filters-prefetch", daemon=True).start()
 
     def place_order(self, req: OrderRequest, source: str = "cli", strict: bool = False) -> OrderResponse:
-        logger.info("Placing order (source=%s): %s", source, asdict(req))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Placing order (source=%s): %r", source, req)
         try:
             req.validate()
         except Exception as e:  # noqa: BLE001
             logger.error("Validation failed: %s", e)
             return OrderResponse(success=False, raw={}, error=str(e))
 
+        symbol, side, ot, qty, tif = req.symbol, req.side, req.order_type, req.quantity, req.time_in_force
         if self.settings.dry_run:
             logger.info("Dry-run: simulating order placement.")
             fake_resp = {
-                "symbol": req.symbol,
-                "side": req.side,
-                "type": req.order_type,
+                "symbol": symbol,
+                "side": side,
+                "type": ot,
                 "status": "SIMULATED",
-                "origQty": req.quantity,
+                "origQty": qty,
                 "price": req.price,
                 "stopPrice": req.stop_price,
                 "source": source,
             }
             return OrderResponse(success=True, raw=fake_resp)
 
+        symbol = symbol.upper()
         params: Dict[str, Any] = {
-            "symbol": req.symbol.upper(),
-            "side": req.side,
-            "quantity": req.quantity,
+            "symbol": symbol,
+            "side": side,
+            "quantity": qty,
         }
         # Ensure filters (only for non-market for price/qty normalization)
         try:
             self._symbol_filters.ensure(self.client)
-            filt = self._symbol_filters.get(req.symbol)
+            filt = self._symbol_filters.get(symbol)
         except Exception as _e:  # noqa: BLE001
             filt = None
         # Adjust quantity if filter available
         if filt:
-            if not filt.is_qty_valid(req.quantity):
+            if not filt.is_qty_valid(qty):
                 try:
-                    adj_qty = filt.adjust_quantity(req.quantity)
+                    adj_qty = filt.adjust_quantity(qty)
                     if strict:
-                        return OrderResponse(False, {}, f"Quantity not valid step size (wanted {req.quantity}, nearest {adj_qty})")
-                    if adj_qty != req.quantity:
+                        return OrderResponse(False, {}, f"Quantity not valid step size (wanted {qty}, nearest {adj_qty})")
+                    if adj_qty != qty:
                         logger.info(
                             "Adjusted quantity from %s to %s based on step size (source=%s)",
-                            req.quantity,
+                            qty,
                             adj_qty,
                             source,
                         )
                     params["quantity"] = adj_qty
                 except Exception as e:  # noqa: BLE001
                     return OrderResponse(False, {}, f"Quantity invalid: {e}")
-        ot = req.order_type
-        if ot == "market":
-            params["type"] = "MARKET"
-        elif ot == "limit":
-            params["type"] = "LIMIT"
-            params["timeInForce"] = req.time_in_force
-            price_val = req.price
-            if filt and price_val is not None and not filt.is_price_valid(price_val):
-                try:
-                    adj = filt.adjust_price(price_val)
-                    if strict:
-                        return OrderResponse(False, {}, f"Price not valid tick size (wanted {price_val}, nearest {adj})")
-                    if adj != price_val:
-                        logger.info(
-                            "Adjusted price from %s to %s based on tick size (source=%s)",
-                            price_val,
-                            adj,
-                            source,
-                        )
-                    price_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Price invalid: {e}")
-            params["price"] = price_val
-        elif ot == "stop_limit":
-            params["type"] = "STOP"
-            params["timeInForce"] = req.time_in_force
-            price_val = req.price
-            stop_val = req.stop_price
-            if filt and price_val is not None and not filt.is_price_valid(price_val):
-                try:
-                    adj = filt.adjust_price(price_val)
-                    if strict:
-                        return OrderResponse(False, {}, f"Price not valid tick size (wanted {price_val}, nearest {adj})")
-                    if adj != price_val:
-                        logger.info(
-                            "Adjusted price from %s to %s based on tick size (source=%s)",
-                            price_val,
-                            adj,
-                            source,
-                        )
-                    price_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Price invalid: {e}")
-            if filt and stop_val is not None and not filt.is_price_valid(stop_val):
-                try:
-                    adj = filt.adjust_price(stop_val)
-                    if strict:
-                        return OrderResponse(False, {}, f"Stop price not valid tick size (wanted {stop_val}, nearest {adj})")
-                    if adj != stop_val:
-                        logger.info(
-                            "Adjusted stopPrice from %s to %s based on tick size (source=%s)",
-                            stop_val,
-                            adj,
-                            source,
-                        )
-                    stop_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Stop price invalid: {e}")
-            params["price"] = price_val
-            params["stopPrice"] = stop_val
-        elif ot == "stop_market":
-            params["type"] = "STOP_MARKET"
-            stop_val = req.stop_price
-            if filt and stop_val is not None and not filt.is_price_valid(stop_val):
-                try:
-                    adj = filt.adjust_price(stop_val)
-                    if strict:
-                        return OrderResponse(False, {}, f"Stop price not valid tick size (wanted {stop_val}, nearest {adj})")
-                    if adj != stop_val:
-                        logger.info(
-                            "Adjusted stopPrice from %s to %s based on tick size (source=%s)",
-                            stop_val,
-                            adj,
-                            source,
-                        )
-                    stop_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Stop price invalid: {e}")
-            params["stopPrice"] = stop_val
-        elif ot == "take_profit":
-            params["type"] = "TAKE_PROFIT"
-            params["timeInForce"] = req.time_in_force
-            price_val = req.price
-            stop_val = req.stop_price
-            if filt and price_val is not None:
-                try:
-                    adj = filt.adjust_price(price_val)
-                    if adj != price_val:
-                        logger.info(
-                            "Adjusted price from %s to %s based on tick size (source=%s)",
-                            price_val,
-                            adj,
-                            source,
-                        )
-                    price_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Price invalid: {e}")
-            if filt and stop_val is not None and not filt.is_price_valid(stop_val):
-                try:
-                    adj = filt.adjust_price(stop_val)
-                    if strict:
-                        return OrderResponse(False, {}, f"Stop price not valid tick size (wanted {stop_val}, nearest {adj})")
-                    if adj != stop_val:
-                        logger.info(
-                            "Adjusted stopPrice from %s to %s based on tick size (source=%s)",
-                            stop_val,
-                            adj,
-                            source,
-                        )
-                    stop_val = adj
-                except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Stop price invalid: {e}")
-            params["price"] = price_val
-            params["stopPrice"] = stop_val
-        elif ot == "take_profit_market":
-            params["type"] = "TAKE_PROFIT_MARKET"
-            stop_val = req.stop_price
-            if filt and stop_val is not None:
+        spec = ORDER_TYPE_SPEC.get(ot)
+        if spec is None:
+            return OrderResponse(success=False, raw={}, error=f"Unsupported order type {ot}")
+        params["type"] = spec.binance_type
+        if spec.tif:
+            params["timeInForce"] = tif
+        # Single normalization pass over the price fields this order type sends
+        for attr, param, label in spec.price_fields:
+            val = getattr(req, attr)
+            if filt and val is not None and not filt.is_price_valid(val):
                 try:
-                    adj = filt.adjust_price(stop_val)
-                    if adj != stop_val:
-                        logger.info(
-                            "Adjusted stopPrice from %s to %s based on tick size (source=%s)",
-                            stop_val,
-                            adj,
-                            source,
-                        )
-                    stop_val = adj
+                    adj = filt.adjust_price(val)
                 except Exception as e:  # noqa: BLE001
-                    return OrderResponse(False, {}, f"Stop price invalid: {e}")
-            params["stopPrice"] = stop_val
-        else:
-            return OrderResponse(success=False, raw={}, error=f"Unsupported order type {ot}")
+                    return OrderResponse(False, {}, f"{label} invalid: {e}")
+                if strict:
+                    return OrderResponse(False, {}, f"{label} not valid tick size (wanted {val}, nearest {adj})")
+                if adj != val:
+                    logger.info(
+                        "Adjusted %s from %s to %s based on tick size (source=%s)",
+                        param,
+                        val,
+                        adj,
+                        source,
+                    )
+                val = adj
+            params[param] = val
 
         try:
+            # Blocks once the burst is spent, so large grids/batches stay under the exchange order limits
+            self._order_limiter.acquire()
             response = self.client.futures_order(**params)
             response["source"] = source  # annotate for downstream logging/inspection
             logger.info(
@@ -278,7 +297,8 @@ class BasicBot:
     def diagnostics(self, symbol: str | None = None) -> Dict[str, Any]:
         """Run simple connectivity + auth diagnostics.
 
-        Returns dict with ping, server time delta, exchange symbol presence, and (if keys) account balance summary.
+        Returns dict with ping, server time delta, exchange symbol presence and filter cache age
+        (plus the last refresh error, if any), and (if keys) account balance summary.
         """
         out: Dict[str, Any] = {}
         try:
@@ -287,17 +307,23 @@ class BasicBot:
             out["ping_error"] = str(e)
         try:
             server = self.client.futures_server_time()
-            import time as _t
-            local_ms = int(_t.time() * 1000)
+            local_ms = time.time_ns() // 1_000_000
             out["server_time"] = server
             out["time_delta_ms"] = local_ms - server.get("serverTime", local_ms)
         except Exception as e:  # noqa: BLE001
             out["time_error"] = str(e)
         try:
-            info = self.client.futures_exchange_info()
-            out["exchange_info_symbols"] = len(info.get("symbols", []))
+            # Reuse the parsed exchangeInfo held by the filter cache
+            cache = self._symbol_filters
+            cache.ensure(self.client)
+            listed = cache.symbols_set
+            out["exchange_info_symbols"] = len(listed)
+            out["exchange_info_age_s"] = round(time.monotonic() - cache.refreshed_at, 1)
+            if cache.last_error:
+                # ensure() keeps serving cached filters when a refresh fails; report it anyway
+                out["exchange_info_error"] = cache.last_error
             if symbol:
-                out["symbol_listed"] = any(s.get("symbol") == symbol.upper() for s in info.get("symbols", []))
+                out["symbol_listed"] = symbol.upper() in listed
         except Exception as e:  # noqa: BLE001
             out["exchange_info_error"] = str(e)
         # Auth-required checks
@@ -330,12 +356,14 @@ class BasicBot:
         time_in_force: str = "GTC",
         dry_run: bool | None = None,
         source: str = "cli-grid",
+        max_workers: int = GRID_MAX_CONCURRENCY,
     ) -> Dict[str, Any]:
         """Create a simple static grid of limit orders around (or one-sided from) current price.
 
         BUY grid: places levels BUY limits below current (descending).
         SELL grid: places levels SELL limits above current (ascending).
         If base_price not provided, fetch ticker price.
+        Live orders are submitted concurrently, at most ``max_workers`` at a time.
         """
         side_u = side.upper()
         if side_u not in VALID_SIDES:
@@ -356,34 +384,51 @@ class BasicBot:
             filt = self._symbol_filters.get(symbol)
         except Exception:  # noqa: BLE001
             pass
-        for i in range(1, levels + 1):
-            if side_u == "BUY":
-                price = base_price * (1 - step_pct / 100 * i)
-            else:
-                price = base_price * (1 + step_pct / 100 * i)
-            price_rounded = price
-            if filt:
-                try:
-                    if not filt.is_price_valid(price):
-                        adj = filt.adjust_price(price)
-                        if adj != price:
-                            logger.info("Grid adjusted price %s -> %s (tick %s)", price, adj, filt.tick_size)
-                        price_rounded = adj
-                except Exception as e:  # noqa: BLE001
-                    logger.warning("Grid price %s invalid: %s", price, e)
-            req = OrderRequest(
-                symbol=symbol.upper(),
-                side=side_u,
-                order_type="limit",
-                quantity=quantity,
-                price=price_rounded,
-            )
-            if dry or self.settings.dry_run:
-                orders.append({"simulated": True, "price": price_rounded, "side": side_u, "source": source})
+        prices = _grid_prices(base_price, step_pct, levels, side_u)
+        if filt and not filt.is_qty_valid(quantity):
+            # Same quantity for every level: normalize once instead of inside each place_order
+            try:
+                adj_qty = filt.adjust_quantity(quantity)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Grid quantity %s invalid: %s", quantity, e)
             else:
-                resp = self.place_order(req, source=source)
+                logger.info("Grid adjusted quantity %s -> %s (step %s)", quantity, adj_qty, filt.step_size)
+                quantity = adj_qty
+        if filt:
+            try:
+                adjusted = filt.adjust_prices(prices)
+            except Exception:  # noqa: BLE001
+                # Some level is out of range: round the others one by one and keep only the bad ones raw
+                adjusted = []
+                for p in prices:
+                    try:
+                        adjusted.append(filt.adjust_price(p))
+                    except Exception as e:  # noqa: BLE001
+                        logger.warning("Grid price %s invalid: %s", p, e)
+                        adjusted.append(p)
+            if adjusted != prices:
+                logger.info("Grid adjusted prices %s -> %s (tick %s)", prices, adjusted, filt.tick_size)
+            prices = adjusted
+        if dry or self.settings.dry_run:
+            orders = [{"simulated": True, "price": p, "side": side_u, "source": source} for p in prices]
+        else:
+            reqs = [
+                OrderRequest(
+                    symbol=symbol.upper(),
+                    side=side_u,
+                    order_type="limit",
+                    quantity=quantity,
+                    price=p,
+                    time_in_force=time_in_force,
+                )
+                for p in prices
+            ]
+            # Submit levels concurrently over the pooled session; map() keeps ladder order.
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(reqs)))) as pool:
+                responses = list(pool.map(lambda r: self.place_order(r, source=source), reqs))
+            for p, resp in zip(prices, responses):
                 orders.append({
-                    "price": price_rounded,
+                    "price": p,
                     "side": side_u,
                     "orderId": resp.raw.get("orderId"),
                     "success": resp.success,
@@ -4,14 +4,20 @@ import hashlib
 import hmac
 import logging
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class BinanceRESTError(RuntimeError):
     def __init__(self, status_code: int, err_code: int | None, msg: str, response_text: str):
@@ -22,6 +28,20 @@ class BinanceRESTError(RuntimeError):
         super().__init__(f"HTTP {status_code} Binance error {err_code}: {msg}")
 
 
+def _format_value(value: Any) -> str:
+    """Render a request parameter value, URL-quoting only when it is not already safe."""
+    if isinstance(value, float):
+        s = repr(value)
+        if "e" in s or "E" in s:
+            # Binance rejects scientific notation (e.g. 1e-05)
+            s = format(Decimal(s), "f")
+        return s
+    if isinstance(value, int):
+        return str(value)
+    s = str(value)
+    return s if s.isascii() and s.isalnum() else quote_plus(s)
+
+
 @dataclass
 class RESTClient:
     api_key: str
@@ -29,14 +49,32 @@ class RESTClient:
     base_url: str
     recv_window: int = 5000
     timeout: int = 10
-
-    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        query = urlencode(params, True)
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
-        params["signature"] = signature
-        return params
+    pool_maxsize: int = 64
+    _secret_bytes: bytes = field(init=False, repr=False)
+    _hmac_template: Any = field(init=False, repr=False)
+    _session: requests.Session = field(init=False, repr=False)
+    # serverTime - local clock, refreshed by futures_server_time()
+    _time_offset_ms: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        # Key the HMAC once; each signature copies the pre-padded state instead
+        # of re-encoding the secret and re-deriving the inner/outer pads.
+        self._secret_bytes = self.api_secret.encode("utf-8")
+        self._hmac_template = hmac.new(self._secret_bytes, None, hashlib.sha256)
+        # One pooled keep-alive session so calls after the first skip the TCP/TLS handshake.
+        self._session = requests.Session()
+        self._session.headers.update({"X-MBX-APIKEY": self.api_key})
+        # Transient 5xx only: retrying 429 pushes Binance towards a 418 IP ban. raise_on_status=False
+        # hands the last failed response back so _request still surfaces Binance's code/msg.
+        retry = Retry(total=2, backoff_factor=0.1, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+        # Sized to cover concurrent callers (grid/batch fan-out, FastAPI's threadpool) without new handshakes
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        self._session.mount("https://", adapter)
+
+    def _sign(self, payload: bytes) -> str:
+        mac = self._hmac_template.copy()
+        mac.update(payload)
+        return mac.hexdigest()
 
     def _request(
         self,
@@ -46,22 +84,35 @@ class RESTClient:
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         params = params or {}
-        headers = {"X-MBX-APIKEY": self.api_key}
+        # Encode once, in insertion order; the signed payload is exactly what is sent.
+        items: List[Tuple[str, str]] = [(k, _format_value(v)) for k, v in params.items() if v is not None]
         if signed:
-            params.setdefault("timestamp", int(time.time() * 1000))
-            params.setdefault("recvWindow", self.recv_window)
-            self._sign(params)
+            if "timestamp" not in params:
+                items.append(("timestamp", str(time.time_ns() // 1_000_000 + self._time_offset_ms)))
+            if "recvWindow" not in params:
+                items.append(("recvWindow", str(self.recv_window)))
+        query = "&".join(f"{k}={v}" for k, v in items)
         url = f"{self.base_url}{path}"
-        logger.debug("Request %s %s params=%s", method, url, params)
-        resp = requests.request(
-            method, url, params=params if method == "GET" else None, data=None if method == "GET" else params, headers=headers, timeout=self.timeout
-        )
-        text = resp.text
+        if method == "GET":
+            if signed:
+                query = f"{query}&signature={self._sign(query.encode('utf-8'))}"
+            logger.debug("Request %s %s query=%s", method, url, query)
+            resp = self._session.request(method, f"{url}?{query}" if query else url, timeout=self.timeout)
+        else:
+            # Sign the exact bytes that go on the wire and hand requests the finished body
+            body = query.encode("utf-8")
+            if signed:
+                body += b"&signature=" + self._sign(body).encode("ascii")
+            logger.debug("Request %s %s body=%s", method, url, body)
+            resp = self._session.request(method, url, data=body, headers=_FORM_HEADERS, timeout=self.timeout)
+        content = resp.content
         try:
-            data = resp.json()
-        except Exception:  # noqa: BLE001
-            data = {"raw": text}
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            data = {"raw": content.decode("utf-8", "replace")}
         if resp.status_code >= 400 or (isinstance(data, dict) and data.get("code", 0) < 0):
+            # Only the error path needs the body as text
+            text = content.decode("utf-8", "replace")
             err_code = data.get("code") if isinstance(data, dict) else None
             msg = data.get("msg") if isinstance(data, dict) else text
             logger.error("Binance REST error %s %s", err_code, msg)
@@ -83,7 +134,13 @@ class RESTClient:
         return self._request("GET", "/fapi/v1/ping")
 
     def futures_server_time(self) -> Dict[str, Any]:
-        return self._request("GET", "/fapi/v1/time")
+        sent_ns = time.time_ns()
+        data = self._request("GET", "/fapi/v1/time")
+        server_ms = data.get("serverTime")
+        if isinstance(server_ms, int):
+            # Compare against the round-trip midpoint; later signed requests reuse the offset
+            self._time_offset_ms = server_ms - (sent_ns + time.time_ns()) // 2_000_000
+        return data
 
     def futures_account(self) -> Dict[str, Any]:
         return self._request("GET", "/fapi/v2/account", signed=True)
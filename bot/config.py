@@ -8,6 +8,16 @@ from dotenv import load_dotenv
 
 BINANCE_FUTURES_TESTNET_BASE = "https://testnet.binancefuture.com"
 
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Parse ``.env`` into the environment on first use only."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(override=True)
+        _DOTENV_LOADED = True
+
 
 @dataclass
 class Settings:
@@ -17,10 +27,11 @@ class Settings:
     recv_window: int = 5000
     dry_run: bool = False
     log_level: str = "INFO"
+    http_pool_size: int = 64
 
     @classmethod
     def load(cls, override: Optional[dict] = None) -> "Settings":
-        load_dotenv(override=True)
+        _load_dotenv_once()
         override = override or {}
         return cls(
             api_key=override.get("api_key") or os.getenv("BINANCE_API_KEY"),
@@ -29,4 +40,5 @@ class Settings:
             recv_window=int(override.get("recv_window") or os.getenv("BINANCE_RECV_WINDOW", 5000)),
             dry_run=bool(override.get("dry_run") or os.getenv("DRY_RUN", "").lower() in {"1", "true", "yes"}),
             log_level=override.get("log_level") or os.getenv("LOG_LEVEL", "INFO"),
+            http_pool_size=int(override.get("http_pool_size") or os.getenv("BINANCE_HTTP_POOL_SIZE", 64)),
         )
@@ -1,11 +1,16 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
 def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     """Configure root logger with console + rotating file handlers.
 
+    Records are handed to a background ``QueueListener`` so callers only pay
+    for an in-memory enqueue; formatting and disk/console IO happen off-thread.
+
     Args:
         log_level: Minimum log level.
         log_dir: Directory to write log file.
@@ -33,5 +38,10 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     console_handler.setFormatter(console_fmt)
     console_handler.setLevel(level)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    # Drain pending records before the interpreter exits
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, holding at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/check meanwhile
+            time.sleep(wait)
@@ -1,11 +1,54 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, ROUND_DOWN, getcontext
-from typing import Any, Dict, Optional
+import functools
+import logging
+import math
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_FLOOR
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@functools.lru_cache(maxsize=1024)
+def canonical_symbol(symbol: str) -> str:
+    """Upper-cased, interned symbol as used for cache keys and order params."""
+    return sys.intern(symbol.upper())
+
+
+def _floor_units(value: float, scale: int) -> Tuple[int, bool]:
+    """Floor ``value * scale`` to an int; the flag says whether ``value`` sat exactly on that grid.
+
+    Raises ValueError for inf/nan, which have no fixed-point form.
+    """
+    if isinstance(value, (Decimal, str)):
+        # Callers already holding decimal values get exact arithmetic instead of a float round-trip
+        dec = Decimal(value)
+        if not dec.is_finite():
+            raise ValueError(f"Non-finite value {value}")
+        exact_scaled = dec * scale
+        n = int(exact_scaled.to_integral_value(rounding=ROUND_FLOOR))
+        return n, n == exact_scaled
+    if not math.isfinite(value):
+        raise ValueError(f"Non-finite value {value}")
+    scaled = value * scale
+    n = round(scaled)
+    if n / scale == value:
+        return n, True
+    n = math.floor(scaled)
+    if n == scaled and n / scale > value:
+        # Product rounded up onto an integer; the true value lies just below it
+        n -= 1
+    return n, False
+
+
+_NO_FILTER: Dict[str, Any] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class SymbolFilters:
     symbol: str
     price_min: Decimal
@@ -14,100 +57,171 @@ class SymbolFilters:
     lot_min: Decimal
     lot_max: Decimal
     step_size: Decimal
+    # Fixed-point mirrors (value * _scale) used by the validation hot path;
+    # the Decimal fields above are kept for display at the edges.
+    _scale: int = field(init=False, repr=False, compare=False)
+    _price_min_i: int = field(init=False, repr=False, compare=False)
+    _price_max_i: float = field(init=False, repr=False, compare=False)  # math.inf when unbounded
+    _tick_i: int = field(init=False, repr=False, compare=False)
+    _lot_min_i: int = field(init=False, repr=False, compare=False)
+    _lot_max_i: float = field(init=False, repr=False, compare=False)  # math.inf when unbounded
+    _step_i: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        decs = (self.price_min, self.price_max, self.tick_size, self.lot_min, self.lot_max, self.step_size)
+        scale = 10 ** max(0, *(-d.as_tuple().exponent for d in decs))
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        setattr_ = object.__setattr__
+        setattr_(self, "_scale", scale)
+        setattr_(self, "_price_min_i", int(self.price_min * scale))
+        # A zero max means "no upper bound"; store +inf so range checks need no extra branch
+        setattr_(self, "_price_max_i", int(self.price_max * scale) or math.inf)
+        setattr_(self, "_tick_i", int(self.tick_size * scale))
+        setattr_(self, "_lot_min_i", int(self.lot_min * scale))
+        setattr_(self, "_lot_max_i", int(self.lot_max * scale) or math.inf)
+        setattr_(self, "_step_i", int(self.step_size * scale))
 
     @classmethod
     def from_exchange_symbol(cls, sym_data: Dict[str, Any]) -> "SymbolFilters":
-        sym = sym_data["symbol"]
-        price_min = Decimal("0")
-        price_max = Decimal("0")
-        tick_size = Decimal("1")
-        lot_min = Decimal("0")
-        lot_max = Decimal("0")
-        step_size = Decimal("1")
-        for f in sym_data.get("filters", []):
-            ftype = f.get("filterType")
-            if ftype == "PRICE_FILTER":
-                price_min = Decimal(f.get("minPrice", "0"))
-                price_max = Decimal(f.get("maxPrice", "0"))
-                tick_size = Decimal(f.get("tickSize", "1"))
-            elif ftype in {"LOT_SIZE", "MARKET_LOT_SIZE"}:
-                lot_min = Decimal(f.get("minQty", "0"))
-                lot_max = Decimal(f.get("maxQty", "0"))
-                step_size = Decimal(f.get("stepSize", "1"))
+        # Index filters by type once, then read the two we need directly
+        by_type = {f.get("filterType"): f for f in sym_data.get("filters", ())}
+        pf = by_type.get("PRICE_FILTER") or _NO_FILTER
+        # LOT_SIZE governs limit orders; MARKET_LOT_SIZE is only a fallback
+        lf = by_type.get("LOT_SIZE") or by_type.get("MARKET_LOT_SIZE") or _NO_FILTER
         return cls(
-            symbol=sym,
-            price_min=price_min,
-            price_max=price_max,
-            tick_size=tick_size,
-            lot_min=lot_min,
-            lot_max=lot_max,
-            step_size=step_size,
+            symbol=sym_data["symbol"],
+            price_min=Decimal(pf.get("minPrice", "0")),
+            price_max=Decimal(pf.get("maxPrice", "0")),
+            tick_size=Decimal(pf.get("tickSize", "1")),
+            lot_min=Decimal(lf.get("minQty", "0")),
+            lot_max=Decimal(lf.get("maxQty", "0")),
+            step_size=Decimal(lf.get("stepSize", "1")),
         )
 
     def is_price_valid(self, price: float) -> bool:
-        p = Decimal(str(price))
-        if self.tick_size <= 0:
+        tick, pmin, pmax = self._tick_i, self._price_min_i, self._price_max_i
+        if tick <= 0:
             return True
-        if p < self.price_min:
+        try:
+            p, exact = _floor_units(price, self._scale)
+        except ValueError:
             return False
-        if self.price_max > 0 and p > self.price_max:
+        if not exact:
+            # Finer than any filter precision, so it cannot be a tick multiple
             return False
-        # Use quantization check
-        # Normalize difference
-        diff = (p - self.price_min) / self.tick_size
-        return diff == diff.to_integral_value()
+        return pmin <= p <= pmax and (p - pmin) % tick == 0
 
     def adjust_price(self, price: float) -> float:
         """Floor price to nearest valid tick multiple from price_min."""
-        p = Decimal(str(price))
-        if self.tick_size <= 0:
-            return float(p)
-        if p < self.price_min:
+        scale, tick, pmin, pmax = self._scale, self._tick_i, self._price_min_i, self._price_max_i
+        if tick <= 0:
+            return price
+        p, exact = _floor_units(price, scale)
+        if p < pmin:
             raise ValueError(f"Price {price} < min price {self.price_min}")
-        if self.price_max > 0 and p > self.price_max:
+        if p > pmax or (not exact and p >= pmax):
             raise ValueError(f"Price {price} > max price {self.price_max}")
-        steps = ((p - self.price_min) / self.tick_size).to_integral_value(rounding=ROUND_DOWN)
-        return float(self.price_min + steps * self.tick_size)
+        return (pmin + (p - pmin) // tick * tick) / scale
+
+    def adjust_prices(self, prices: Iterable[float]) -> List[float]:
+        """Bulk ``adjust_price`` for a whole grid ladder; raises ValueError if any price is out of range."""
+        scale, tick, pmin, pmax = self._scale, self._tick_i, self._price_min_i, self._price_max_i
+        if tick <= 0:
+            return list(prices)
+        out = []
+        for price in prices:
+            p, exact = _floor_units(price, scale)
+            if p < pmin:
+                raise ValueError(f"Price {price} < min price {self.price_min}")
+            if p > pmax or (not exact and p >= pmax):
+                raise ValueError(f"Price {price} > max price {self.price_max}")
+            out.append((pmin + (p - pmin) // tick * tick) / scale)
+        return out
 
     def is_qty_valid(self, qty: float) -> bool:
-        q = Decimal(str(qty))
-        if q < self.lot_min:
+        step, lmin, lmax = self._step_i, self._lot_min_i, self._lot_max_i
+        try:
+            q, exact = _floor_units(qty, self._scale)
+        except ValueError:
             return False
-        if self.lot_max > 0 and q > self.lot_max:
+        if q < lmin or q > lmax or (not exact and q >= lmax):
             return False
-        if self.step_size <= 0:
+        if step <= 0:
             return True
-        diff = (q - self.lot_min) / self.step_size
-        return diff == diff.to_integral_value()
+        return exact and (q - lmin) % step == 0
 
     def adjust_quantity(self, qty: float) -> float:
-        q = Decimal(str(qty))
-        if q < self.lot_min:
+        scale, step, lmin, lmax = self._scale, self._step_i, self._lot_min_i, self._lot_max_i
+        q, exact = _floor_units(qty, scale)
+        if q < lmin:
             raise ValueError(f"Quantity {qty} < min qty {self.lot_min}")
-        if self.lot_max > 0 and q > self.lot_max:
+        if q > lmax or (not exact and q >= lmax):
             raise ValueError(f"Quantity {qty} > max qty {self.lot_max}")
-        if self.step_size <= 0:
-            return float(q)
-        steps = ((q - self.lot_min) / self.step_size).to_integral_value(rounding=ROUND_DOWN)
-        return float(self.lot_min + steps * self.step_size)
+        if step <= 0:
+            return qty
+        return (lmin + (q - lmin) // step * step) / scale
 
 
 class SymbolFilterCache:
-    def __init__(self):
+    def __init__(self, ttl: float = 600.0):
         self._cache: Dict[str, SymbolFilters] = {}
         self._loaded = False
+        self.symbols_set: frozenset[str] = frozenset()
+        self._lock = threading.Lock()
+        self.ttl = ttl
+        # Monotonic time of the last successful load
+        self.refreshed_at = 0.0
+        # Next time ensure() may fetch; pushed forward on failed refreshes too
+        self._next_refresh = 0.0
+        # Message from the most recent failed refresh, cleared by the next successful one
+        self.last_error: Optional[str] = None
 
-    def ensure(self, rest_client, force: bool = False) -> None:
-        if self._loaded and not force:
-            return
+    def _is_fresh(self) -> bool:
+        return self._loaded and time.monotonic() < self._next_refresh
+
+    def refresh(self, rest_client) -> None:
         data = rest_client.futures_exchange_info()
-        for sym in data.get("symbols", []):
+        symbols = data.get("symbols", [])
+        cache: Dict[str, SymbolFilters] = {}
+        for sym in symbols:
             try:
                 filt = SymbolFilters.from_exchange_symbol(sym)
-                self._cache[filt.symbol] = filt
+                cache[filt.symbol] = filt
             except Exception:
                 continue
+        # Swap in the new map whole so concurrent readers never see a partial load
+        self._cache = cache
+        self.symbols_set = frozenset(s.get("symbol") for s in symbols)
+        self.refreshed_at = time.monotonic()
+        self._next_refresh = self.refreshed_at + self.ttl
+        self.last_error = None
         self._loaded = True
 
+    def ensure(self, rest_client, force: bool = False) -> None:
+        if not force and self._loaded and time.monotonic() < self._next_refresh:
+            return
+        # Serialize loads. Before the first load a caller waits for the one in flight; once
+        # filters exist, an unforced caller keeps using them rather than queue behind a refresh.
+        if not self._lock.acquire(blocking=force or not self._loaded):
+            return
+        try:
+            if not force and self._is_fresh():
+                return
+            try:
+                self.refresh(rest_client)
+            except Exception as e:  # noqa: BLE001
+                self.last_error = str(e)
+                if not self._loaded:
+                    raise
+                # Back off for a full interval so order-path callers serve stale filters
+                # instead of each retrying a slow exchangeInfo fetch
+                self._next_refresh = time.monotonic() + self.ttl
+                logger.warning("Symbol filter refresh failed, keeping cached filters: %s", e)
+        finally:
+            self._lock.release()
+
     def get(self, symbol: str) -> Optional[SymbolFilters]:
-        return self._cache.get(symbol.upper())
+        cache = self._cache
+        # Callers usually pass the canonical form already; only normalize on a miss
+        filt = cache.get(symbol)
+        return filt if filt is not None else cache.get(canonical_symbol(symbol))
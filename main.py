@@ -1,19 +1,48 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
-from bot.basic_bot import BasicBot, OrderRequest
+import orjson
+
+from bot.basic_bot import BasicBot, OrderRequest, non_zero_positions
 from bot.config import Settings
 from bot.logging_config import setup_logging
 
+# Orders kept in flight concurrently in --batch mode; the order rate itself is
+# limited by BasicBot's shared token bucket
+BATCH_WORKERS = 8
+
+
+def _emit(obj: Any, pretty: bool = True) -> None:
+    """Write ``obj`` as a JSON line to stdout; non-JSON values fall back to str().
 
+    orjson already produces UTF-8 bytes, so they go to the binary buffer directly
+    instead of being decoded and re-encoded by the text wrapper.
+    """
+    option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+    data = orjson.dumps(obj, option=option, default=str)
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is None:  # e.g. stdout replaced by a StringIO
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    buf.write(data)
+    buf.flush()
+
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # Built once per process; parse_args() returns a fresh Namespace each call
     p = argparse.ArgumentParser(description="Binance Futures Testnet Trading Bot")
-    p.add_argument("--symbol", required=True, help="Trading pair symbol e.g. BTCUSDT")
-    p.add_argument("--side", required=True, choices=["BUY", "SELL"], help="Order side")
+    # --symbol/--side/--quantity are required except with --batch (checked in main)
+    p.add_argument("--symbol", help="Trading pair symbol e.g. BTCUSDT")
+    p.add_argument("--side", choices=["BUY", "SELL"], help="Order side")
     p.add_argument(
         "--type",
         required=False,
@@ -28,7 +57,7 @@ def build_parser() -> argparse.ArgumentParser:
         ],
         help="Order type (default market)",
     )
-    p.add_argument("--quantity", required=True, type=float, help="Order quantity")
+    p.add_argument("--quantity", type=float, help="Order quantity")
     p.add_argument("--price", type=float, help="Limit price (for limit/stop_limit)")
     p.add_argument("--stop-price", type=float, dest="stop_price", help="Stop trigger price (stop_limit)")
     p.add_argument(
@@ -50,15 +79,92 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--step-pct", type=float, dest="step_pct", help="Percentage step between grid levels")
     p.add_argument("--base-price", type=float, dest="base_price", help="Optional manual base price for grid")
     p.add_argument("--interactive", action="store_true", help="Interactive prompt mode (ignores other order args unless grid specified)")
+    p.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Read orders from stdin, one 'SYMBOL SIDE TYPE QTY [PRICE] [STOP]' per line ('-' skips a price); "
+            "each line is submitted as it arrives and results print in input order"
+        ),
+    )
     p.add_argument("--balance", action="store_true", help="Show futures account balance summary and exit")
     p.add_argument("--positions", action="store_true", help="Show open positions and exit")
     p.add_argument("--strict-prices", action="store_true", help="Reject (do not auto-adjust) invalid tick/step sizes")
     return p
 
 
+def _batch_price(field: str | None) -> float | None:
+    return None if field is None or field == "-" else float(field)
+
+
+def _parse_batch_line(line: str, time_in_force: str) -> OrderRequest:
+    fields = line.split()
+    if not 4 <= len(fields) <= 6:
+        raise ValueError("expected SYMBOL SIDE TYPE QTY [PRICE] [STOP]")
+    fields += [None] * (6 - len(fields))
+    sym, side, otype, qty, price, stop = fields
+    return OrderRequest(
+        symbol=sym.upper(),
+        side=side.upper(),
+        order_type=otype.lower(),
+        quantity=float(qty),
+        price=_batch_price(price),
+        stop_price=_batch_price(stop),
+        time_in_force=time_in_force,
+    )
+
+
+def run_batch(bot: BasicBot, args: argparse.Namespace) -> int:
+    """Place orders read line-by-line from stdin, several at a time.
+
+    Each line is ``SYMBOL SIDE TYPE QTY [PRICE] [STOP]``; blank lines and ``#`` comments
+    are skipped. Orders are submitted as lines arrive, so a live pipe is served without
+    waiting for EOF. Results are printed as JSON lines in input order.
+    """
+
+    def submit(lineno: int, req: OrderRequest) -> dict[str, Any]:
+        resp = bot.place_order(req, source="cli-batch", strict=args.strict_prices)
+        return {"line": lineno, "success": resp.success, "error": resp.error, "data": resp.raw}
+
+    ok = True
+    pending: deque[Future[dict[str, Any]]] = deque()
+    lock = threading.Lock()
+
+    def flush(_done: Future[dict[str, Any]] | None = None) -> None:
+        # Runs as each order finishes; emits completed results from the head only, keeping input order
+        nonlocal ok
+        with lock:
+            while pending and pending[0].done():
+                result = pending.popleft().result()
+                ok = ok and result["success"]
+                _emit(result, pretty=False)
+
+    # Overlap the HTTP round-trips across BATCH_WORKERS threads
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+        for lineno, line in enumerate(iter(sys.stdin.readline, ""), 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                req = _parse_batch_line(line, args.time_in_force)
+            except ValueError as e:
+                fut: Future[dict[str, Any]] = Future()
+                fut.set_result({"line": lineno, "success": False, "error": str(e), "data": {}})
+            else:
+                fut = pool.submit(submit, lineno, req)
+            with lock:
+                pending.append(fut)
+            fut.add_done_callback(flush)
+    flush()
+    return 0 if ok else 1
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if not args.batch:
+        missing = [f"--{name}" for name in ("symbol", "side", "quantity") if getattr(args, name) is None]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
 
     settings = Settings.load(
         {
@@ -70,11 +176,12 @@ def main(argv: list[str] | None = None) -> int:
     )
     setup_logging(settings.log_level)
 
-    bot = BasicBot(settings)
+    # Only the long-running modes benefit from the warm-up / filter refresh thread
+    bot = BasicBot(settings, background_refresh=args.interactive or args.batch)
 
     if args.diagnostic or args.diagnostic_only:
         diag = bot.diagnostics(symbol=args.symbol)
-        print(json.dumps({"diagnostics": diag}, indent=2))
+        _emit({"diagnostics": diag})
         if args.diagnostic_only:
             return 0
 
@@ -84,9 +191,9 @@ def main(argv: list[str] | None = None) -> int:
             return 0
         try:
             bal = bot.client.futures_account_balance()
-            print(json.dumps({"balance": bal}, indent=2))
+            _emit({"balance": bal})
         except Exception as e:  # noqa: BLE001
-            print(json.dumps({"error": str(e)}))
+            _emit({"error": str(e)}, pretty=False)
         return 0
 
     if args.positions:
@@ -95,11 +202,10 @@ def main(argv: list[str] | None = None) -> int:
             return 0
         try:
             pr = bot.client.futures_position_risk()
-            # Filter non-zero positions
-            non_zero = [p for p in pr if float(p.get("positionAmt", 0)) != 0]
-            print(json.dumps({"positions": non_zero}, indent=2))
+            non_zero = non_zero_positions(pr)
+            _emit({"positions": non_zero})
         except Exception as e:  # noqa: BLE001
-            print(json.dumps({"error": str(e)}))
+            _emit({"error": str(e)}, pretty=False)
         return 0
     if args.grid:
         if not (args.levels and args.step_pct and args.quantity):
@@ -115,9 +221,12 @@ def main(argv: list[str] | None = None) -> int:
             time_in_force=args.time_in_force,
             source="cli-grid",
         )
-        print(json.dumps(grid_result, indent=2))
+        _emit(grid_result)
         return 0
 
+    if args.batch:
+        return run_batch(bot, args)
+
     if args.interactive:
         print("Interactive mode. Press Ctrl+C to exit.")
         while True:
@@ -138,7 +247,7 @@ def main(argv: list[str] | None = None) -> int:
                     time_in_force=args.time_in_force,
                 )
                 resp = bot.place_order(req, source="cli-interactive")
-                print(json.dumps({"success": resp.success, "error": resp.error, "data": resp.raw}, indent=2))
+                _emit({"success": resp.success, "error": resp.error, "data": resp.raw})
             except KeyboardInterrupt:
                 print("\nExiting interactive mode.")
                 break
@@ -158,7 +267,7 @@ def main(argv: list[str] | None = None) -> int:
     )
     response = bot.place_order(order_req, source="cli", strict=args.strict_prices)
     output: dict[str, Any] = {"success": response.success, "error": response.error, "data": response.raw}
-    print(json.dumps(output, indent=2, default=str))
+    _emit(output)
     return 0 if response.success else 1
 
 
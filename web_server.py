@@ -1,35 +1,71 @@
 from __future__ import annotations
 
+import gzip
 import json
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 
 from bot.config import Settings
-from bot.basic_bot import BasicBot, OrderRequest
+from bot.basic_bot import BasicBot, OrderRequest, non_zero_positions
 from bot.logging_config import setup_logging
+from bot.symbol_filters import canonical_symbol
 
-settings = Settings.load()
-setup_logging(settings.log_level)
-bot = BasicBot(settings)
 
-app = FastAPI(title="Futures Testnet Trading Bot", version="0.1.0")
+@lru_cache(maxsize=1)
+def _build_bot() -> BasicBot:
+    """Build the shared bot on first use instead of at import time."""
+    settings = Settings.load()
+    setup_logging(settings.log_level)
+    return BasicBot(settings)
 
 
-class OrderIn(BaseModel):
+async def get_bot() -> BasicBot:
+    """Route dependency; async so FastAPI resolves it on the event loop, not via the threadpool."""
+    return _build_bot()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; FastAPI's own ORJSONResponse is deprecated from 0.131."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Overlap the exchangeInfo fetch with server startup so the first request finds filters loaded
+    bot = _build_bot()
+    bot.prefetch_filters()
+    yield
+    bot.close()
+
+
+app = FastAPI(
+    title="Futures Testnet Trading Bot",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
+class OrderIn(msgspec.Struct):
     symbol: str
     side: str
-    order_type: str = Field(alias="type")
+    order_type: str = msgspec.field(name="type")
     quantity: float
     price: Optional[float] = None
     stop_price: Optional[float] = None
     time_in_force: str = "GTC"
 
 
-class GridIn(BaseModel):
+class GridIn(msgspec.Struct):
     symbol: str
     side: str
     levels: int
@@ -38,16 +74,37 @@ class GridIn(BaseModel):
     base_price: Optional[float] = None
 
 
+def _json_body(model: type):
+    """Dependency decoding the raw request body straight into a msgspec Struct."""
+    # Lax mode keeps accepting numeric strings such as "quantity": "0.001", as the Pydantic models did
+    decoder = msgspec.json.Decoder(model, strict=False)
+
+    async def _decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:  # includes ValidationError
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return _decode
+
+
+def _body_openapi(model: type) -> dict:
+    """``openapi_extra`` describing a msgspec body, which FastAPI cannot see through ``_json_body``."""
+    _, components = msgspec.json.schema_components([model])
+    schema = components[model.__name__]
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
 @app.get("/api/diagnostics")
-def api_diagnostics(symbol: str | None = None):
+def api_diagnostics(symbol: str | None = None, bot: BasicBot = Depends(get_bot)):
     return bot.diagnostics(symbol)
 
 
 @app.get("/api/filters")
-def api_filters(symbol: str):
+def api_filters(symbol: str, bot: BasicBot = Depends(get_bot)):
   try:
     bot._symbol_filters.ensure(bot.client)  # type: ignore[attr-defined]
-    filt = bot._symbol_filters.get(symbol)  # type: ignore[attr-defined]
+    filt = bot._symbol_filters.get(canonical_symbol(symbol))  # type: ignore[attr-defined]
     if not filt:
       raise HTTPException(status_code=404, detail="Symbol filters not found")
     return {
@@ -65,10 +122,10 @@ def api_filters(symbol: str):
     raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.post("/api/order")
-def api_order(order: OrderIn):
+@app.post("/api/order", openapi_extra=_body_openapi(OrderIn))
+def api_order(order: OrderIn = Depends(_json_body(OrderIn)), bot: BasicBot = Depends(get_bot)):
   req = OrderRequest(
-    symbol=order.symbol.upper(),
+    symbol=canonical_symbol(order.symbol),
     side=order.side.upper(),
     order_type=order.order_type,
     quantity=order.quantity,
@@ -82,8 +139,8 @@ def api_order(order: OrderIn):
   return resp.raw
 
 
-@app.post("/api/grid")
-def api_grid(grid: GridIn):
+@app.post("/api/grid", openapi_extra=_body_openapi(GridIn))
+def api_grid(grid: GridIn = Depends(_json_body(GridIn)), bot: BasicBot = Depends(get_bot)):
   result = bot.place_grid_orders(
     symbol=grid.symbol,
     side=grid.side,
@@ -97,7 +154,7 @@ def api_grid(grid: GridIn):
 
 
 @app.get("/api/balance")
-def api_balance():
+def api_balance(bot: BasicBot = Depends(get_bot)):
     if bot.settings.dry_run:
         return {"dry_run": True}
     try:
@@ -107,13 +164,12 @@ def api_balance():
 
 
 @app.get("/api/positions")
-def api_positions():
+def api_positions(bot: BasicBot = Depends(get_bot)):
     if bot.settings.dry_run:
         return {"dry_run": True}
     try:
         pr = bot.client.futures_position_risk()
-        nz = [p for p in pr if float(p.get("positionAmt", 0)) != 0]
-        return {"positions": nz}
+        return {"positions": non_zero_positions(pr)}
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -201,9 +257,21 @@ HTML_TEMPLATE = """
 """
 
 
+# Encoded (and gzip-compressed) once at import; the page is static
+_HTML_BYTES = HTML_TEMPLATE.encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9)
+_HTML_HEADERS = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+
+
 @app.get("/")
-def root_html():  # pragma: no cover - simple HTML route
-    return HTMLResponse(content=HTML_TEMPLATE)
+def root_html(request: Request):  # pragma: no cover - simple HTML route
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_HTML_GZ,
+            media_type="text/html",
+            headers={**_HTML_HEADERS, "Content-Encoding": "gzip"},
+        )
+    return Response(content=_HTML_BYTES, media_type="text/html", headers=_HTML_HEADERS)
 
 
 if __name__ == "__main__":  # pragma: no cover